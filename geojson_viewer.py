@@ -6,99 +6,244 @@ This plugin is developed for QGIS (https://qgis.org), an open-source GIS platfor
 
 Licensed under the GNU General Public License v2 (GPLv2)
 """
-from qgis.core import QgsVectorLayer, QgsProject, QgsWkbTypes, QgsEditorWidgetSetup
+from qgis.core import QgsVectorLayer, QgsProject, QgsEditorWidgetSetup, QgsFeatureRequest, QgsJsonUtils, edit
 from qgis.PyQt.QtWidgets import (
     QAction, QLineEdit, QDialog, QFormLayout, QPushButton, QSpinBox,
     QMessageBox, QListWidget, QMenu, QTextEdit, QCheckBox
 )
-from qgis.PyQt.QtCore import QTimer, QSettings, Qt, QVariant, QDate, QThreadPool, QRunnable, pyqtSignal, QObject
+from qgis.PyQt.QtCore import QTimer, QSettings, Qt, QVariant, QDate, QThread, QThreadPool, QRunnable, pyqtSignal, QObject
 from qgis.utils import iface
+from osgeo import gdal
+import asyncio
+import gzip
 import json
+import threading
 import requests
-import tempfile
+from requests.adapters import HTTPAdapter, Retry
 import hashlib
-import numbers
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Change detection only needs a fast digest, not a cryptographic one.
+# Prefer blake3 (SIMD, GB/s), then xxhash, then fall back to md5.
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    try:
+        from xxhash import xxh3_64 as _content_hash
+    except ImportError:
+        _content_hash = hashlib.md5
+
+
+def _json_default(obj):
+    if isinstance(obj, QDate):
+        return obj.toString("yyyy-MM-dd")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj):
+    """Serialize to UTF-8 bytes, via orjson when available (much faster on
+    the float-heavy coordinate arrays that dominate GeoJSON)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Decimal places kept on synced coordinates. QGIS emits up to 17 digits
+# by default; 7 (~1 cm at the equator) is plenty for display/survey use
+# and roughly halves the uncompressed geometry bytes.
+COORD_PRECISION = 7
+
+
+def _geometry_to_json(geometry, precision=COORD_PRECISION):
+    """Prepare a QgsGeometry for embedding in a JSON payload.
+
+    geometry.asJson() already returns serialized GeoJSON, with coordinates
+    trimmed to `precision` decimals at the source; with orjson the string
+    is wrapped in a Fragment and spliced verbatim into the payload,
+    skipping the loads/dumps round-trip over every coordinate. The stdlib
+    fallback has no fragment support and parses as before.
+    """
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        return orjson.Fragment(geometry.asJson(precision))
+    return _json_loads(geometry.asJson(precision))
+
+
+def _identity(val):
+    return val
+
+
+# Attribute values are overwhelmingly str/int/float/bool/None; a single
+# type-keyed dict lookup replaces the old cascade of isinstance checks
+# that ran once per cell of every synced feature.
+_CONVERTERS = {
+    QDate: lambda v: v.toString("yyyy-MM-dd"),
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+}
+
+
+def _convert_variant(val):
+    if isinstance(val, QVariant):
+        val = val.value()
+    converter = _CONVERTERS.get(type(val))
+    if converter is not None:
+        return converter(val)
+    try:
+        return str(val)
+    except Exception:
+        return None
+
+
+def _serialize_feature(field_names, feat):
+    properties = dict(zip(field_names, (_convert_variant(v) for v in feat.attributes())))
+    return {
+        "type": "Feature",
+        "geometry": _geometry_to_json(feat.geometry()),
+        "properties": properties
+    }
+
+
+def _post_geojson(session, url, token, payload):
+    """POST a FeatureCollection gzip-compressed; retry uncompressed if the
+    server rejects the encoding with 415. Level 3 gets most of the ratio
+    on GeoJSON text at a fraction of the CPU of the default level."""
+    body = _json_dumps(payload)
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json',
+        'Content-Encoding': 'gzip',
+    }
+    response = session.post(url, headers=headers, data=gzip.compress(body, compresslevel=3))
+    if response.status_code == 415:
+        del headers['Content-Encoding']
+        response = session.post(url, headers=headers, data=body)
+    return response
+
 
 class SyncSignals(QObject):
-    finished = pyqtSignal(str, str)
+    finished = pyqtSignal(str, str, object)
 
 
 class SyncWorker(QRunnable):
-    def __init__(self, layer, url, token, edited_features, added_features, deleted_ids):
+    """POSTs an already-serialized FeatureCollection off the GUI thread.
+
+    Feature serialization stays on the main thread (layer access is not
+    thread-safe); only the network round-trip runs here. layer_ids is
+    passed back on success so the viewer can clear the matching dirty
+    state.
+    """
+
+    def __init__(self, session, url, token, payload, layer_ids):
         super().__init__()
-        self.layer = layer
+        self.session = session
         self.url = url
         self.token = token
-        self.edited_features = edited_features
-        self.added_features = added_features
-        self.deleted_ids = deleted_ids
+        self.payload = payload
+        self.layer_ids = layer_ids
         self.signals = SyncSignals()
 
     def run(self):
         try:
-            changed_ids = self.edited_features | set(self.added_features.keys())
-            if not changed_ids:
-                self.signals.finished.emit("info", "No changes to sync.")
-                return
-
-            features = []
-            for fid in self.edited_features:
-                feat = self.layer.getFeature(fid)
-                feature = self._serialize_feature(feat)
-                feature["__mode"] = "update"
-                features.append(feature)
-
-            for fid, feat in self.added_features.items():
-                feature = self._serialize_feature(feat)
-                feature["__mode"] = "add"
-                features.append(feature)
-
-            payload = {"type": "FeatureCollection", "features": features}
-            headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'}
-            response = requests.post(self.url, headers=headers, data=json.dumps(payload))
-
+            response = _post_geojson(self.session, self.url, self.token, self.payload)
             if response.status_code == 200:
                 msg = response.json().get("message", "Synced successfully.")
-                self.signals.finished.emit("success", msg)
+                self.signals.finished.emit("success", msg, self.layer_ids)
             else:
-                self.signals.finished.emit("error", f"Sync failed: {response.status_code}")
+                self.signals.finished.emit("error", f"Sync failed: {response.status_code}", self.layer_ids)
         except Exception as e:
-            self.signals.finished.emit("error", f"Sync error: {str(e)}")
-
-    def _serialize_feature(self, feat):
-        geometry = feat.geometry()
-        props = feat.attributes()
-        properties = {
-            self.layer.fields().at(i).name(): self.convert_variant(props[i])
-            for i in range(len(props))
-        }
-        return {
-            "type": "Feature",
-            "geometry": json.loads(geometry.asJson()),
-            "properties": properties
-        }
-
-    def convert_variant(self, val):
-        if isinstance(val, QVariant): val = val.value()
-        if hasattr(val, 'toPyObject'): val = val.toPyObject()
-        if isinstance(val, QDate): return val.toString("yyyy-MM-dd")
-        if isinstance(val, (str, numbers.Number, bool)) or val is None: return val
-        try: return str(val)
-        except Exception: return None
-
-
-class GeoJsonViewer:
+            self.signals.finished.emit("error", f"Sync error: {str(e)}", self.layer_ids)
+
+
+class RefreshSignals(QObject):
+    finished = pyqtSignal(str, str, object)
+
+
+class RefreshWorker(QRunnable):
+    """Runs the HTTP fetch + hash for one layer off the GUI thread.
+
+    Only the download and hashing happen here; layer creation and
+    QgsProject mutations stay on the main thread in the finished slot
+    (QGIS map layers are not thread-safe).
+    """
+
+    def __init__(self, fetch, name, url, token):
+        super().__init__()
+        self.fetch = fetch
+        self.name = name
+        self.url = url
+        self.token = token
+        self.signals = RefreshSignals()
+
+    def run(self):
+        hash_val, content = self.fetch(self.url, self.token, self.name)
+        self.signals.finished.emit(self.name, hash_val or "", content)
+
+
+class GeoJsonViewer(QObject):
+    refresh_done = pyqtSignal(str, str, object)
+
     def __init__(self, iface):
+        super().__init__()
         self.iface = iface
         self.layers = {}
         self.layer_hashes = {}
+        self.layer_headers = {}
+        self._vsi_paths = {}
         self.settings = QSettings("GeoJsonViewer", "Plugin")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
         self.timer = QTimer()
         self.timer.timeout.connect(self.refresh_layers)
         self._edited_features = set()
         self._added_features = {}
         self._deleted_ids = set()
+        self._patching = False
+        self._field_names = {}
+        self._pending_sync = {}
+        self._sync_debounce = QTimer()
+        self._sync_debounce.setSingleShot(True)
+        self._sync_debounce.timeout.connect(self._flush_pending_sync)
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._write_bookmarks)
+        self._bookmarks_key = None
         self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(min(8, max(1, QThread.idealThreadCount() - 1)))
+        # With aiohttp available, polls run on a single-thread asyncio loop
+        # with a bounded connection pool instead of one pool thread per
+        # in-flight request. Results hop back via the refresh_done signal.
+        self.refresh_done.connect(self._on_refresh_finished)
+        self._pending_refreshes = 0
+        self._async_loop = None
+        self._aio_session = None
+        if aiohttp is not None:
+            self._async_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._async_loop.run_forever,
+                name="GeoJsonViewerPoll", daemon=True
+            ).start()
         self.init_project_signals()
         self.auth_token = self.settings.value("auth_token", "")
 
@@ -115,6 +260,13 @@ class GeoJsonViewer:
         self.iface.removePluginMenu("&GeoJSON Viewer", self.token_action)
         self.iface.removePluginMenu("&GeoJSON Viewer", self.add_layer_action)
         self.timer.stop()
+        if self._sync_debounce.isActive():
+            self._sync_debounce.stop()
+            self._flush_pending_sync()
+        self._flush_bookmark_save()
+        self._shutdown_async()
+        self.thread_pool.waitForDone(5000)
+        self.session.close()
 
     def show_token_dialog(self):
         dialog = QDialog()
@@ -188,7 +340,7 @@ class GeoJsonViewer:
                 QMessageBox.warning(dialog, "Duplicate Layer", f"Layer '{name}' already exists.")
                 return
 
-            hash_val, content = self.get_geojson_hash(url, token)
+            hash_val, content = self.get_geojson_hash(url, token, name)
             if hash_val is None:
                 QMessageBox.critical(dialog, "GeoJSON Viewer", "Failed to download or parse layer.")
                 return
@@ -196,7 +348,7 @@ class GeoJsonViewer:
             layer = self.create_layer_from_content(content, name)
             if layer and layer.isValid():
                 QgsProject.instance().addMapLayer(layer)
-                self.connect_sync_signal(layer, url, token)
+                self.connect_sync_signal(layer)
                 self.layers[name] = {"url": url, "token": token}
                 self.layer_hashes[name] = hash_val
                 self.save_bookmarks()
@@ -236,69 +388,298 @@ class GeoJsonViewer:
         dialog.exec_()
 
     def reload_layer(self, name, url, token=""):
-        hash_val, content = self.get_geojson_hash(url, token)
-        if hash_val is None:
+        hash_val, content = self.get_geojson_hash(url, token, name)
+        self._apply_refresh(name, hash_val or "", content)
+
+    def _on_refresh_finished(self, name, hash_val, content):
+        if self._pending_refreshes:
+            self._pending_refreshes -= 1
+        # An in-flight poll can outlive the project (or the bookmark); a
+        # late result must not resurrect the layer in the cleared project.
+        if name not in self.layers:
+            return
+        self._apply_refresh(name, hash_val, content)
+
+    def _apply_refresh(self, name, hash_val, content):
+        if not hash_val:
             iface.messageBar().pushCritical("GeoJSON Viewer", f"Failed to check updates for layer '{name}'.")
             return
 
-        layer_present = any(lyr.name() == name for lyr in QgsProject.instance().mapLayers().values())
-        if layer_present and self.layer_hashes.get(name) == hash_val:
+        existing = next(
+            (lyr for lyr in QgsProject.instance().mapLayers().values() if lyr.name() == name),
+            None
+        )
+
+        if content is None:
+            if existing is not None:
+                iface.messageBar().pushInfo("GeoJSON Viewer", f"Layer '{name}' no changes found.")
+                return
+            # Unchanged upstream but missing from the project (removed by
+            # the user, or its creation failed): drop the cached hash and
+            # validators and re-fetch so there is a body to rebuild from.
+            self.layer_hashes.pop(name, None)
+            self.layer_headers.pop(name, None)
+            config = self.layers.get(name, {})
+            hash_val, content = self.get_geojson_hash(config.get("url", ""), config.get("token", ""), name)
+            if not hash_val or content is None:
+                iface.messageBar().pushCritical("GeoJSON Viewer", f"Failed to check updates for layer '{name}'.")
+                return
+        if existing is not None and self.layer_hashes.get(name) == hash_val:
             iface.messageBar().pushInfo("GeoJSON Viewer", f"Layer '{name}' no changes found.")
             return
 
+        if existing is not None and self._patch_layer(existing, content):
+            self.layer_hashes[name] = hash_val
+            iface.messageBar().pushInfo("GeoJSON Viewer", f"Layer '{name}' updated.")
+            return
+
         layer = self.create_layer_from_content(content, name)
         if layer and layer.isValid():
-            if layer_present:
-                for lyr in QgsProject.instance().mapLayers().values():
-                    if lyr.name() == name:
-                        QgsProject.instance().removeMapLayer(lyr.id())
-                        break
+            if existing is not None:
+                # Same cleanup _patch_layer does: nothing referring to the
+                # replaced layer id may survive — a debounced sync or dirty
+                # entry for it would describe a layer that no longer exists.
+                old_id = existing.id()
+                QgsProject.instance().removeMapLayer(old_id)
+                self._pending_sync.pop(old_id, None)
+                self._clear_changes({old_id})
+                self._field_names.pop(old_id, None)
             QgsProject.instance().addMapLayer(layer)
-            self.connect_sync_signal(layer, url, token)
+            self.connect_sync_signal(layer)
             self.layer_hashes[name] = hash_val
             iface.messageBar().pushInfo("GeoJSON Viewer", f"Layer '{name}' updated.")
         else:
             iface.messageBar().pushCritical("GeoJSON Viewer", f"Failed to reload layer '{name}'.")
 
-    def connect_sync_signal(self, layer, url, token):
-        layer.featureAdded.connect(lambda fid: self._added_features.update({fid: layer.getFeature(fid)}))
-        layer.featureDeleted.connect(lambda fid: self._deleted_ids.add(fid))
-        layer.geometryChanged.connect(lambda fid, geom: self._edited_features.add(fid))
-        layer.attributeValueChanged.connect(lambda fid, idx, val: self._edited_features.add(fid))
-        layer.editingStopped.connect(lambda: self.sync_layer_to_server(layer, url, token))
+    def _patch_layer(self, layer, content):
+        """Apply an upstream update to the existing layer as a feature diff.
+
+        Parses the new GeoJSON, keys features by their 'id'/'fid' field and
+        applies only the adds, deletes and modifications to the current
+        layer, preserving selection and symbology. Returns False when a
+        safe diff is impossible (no stable id field, schema changed, or
+        any edit fails) so the caller falls back to a full rebuild.
+        """
+        try:
+            fields = layer.fields()
+            key_idx = next(
+                (fields.lookupField(k) for k in ('id', 'fid') if fields.lookupField(k) != -1),
+                -1
+            )
+            if key_idx == -1:
+                return False
+
+            new_feats = QgsJsonUtils.stringToFeatureList(content.decode('utf-8'), fields)
+            new_by_key = {}
+            for feat in new_feats:
+                key = feat.attribute(key_idx)
+                if key is None:
+                    return False
+                new_by_key[key] = feat
+
+            current_by_key = {}
+            for feat in layer.getFeatures():
+                current_by_key[feat.attribute(key_idx)] = feat
+
+            to_delete = [current_by_key[k].id() for k in current_by_key.keys() - new_by_key.keys()]
+            to_add = []
+            attr_changes = {}
+            geom_changes = {}
+            for key, new_feat in new_by_key.items():
+                cur = current_by_key.get(key)
+                if cur is None:
+                    to_add.append(new_feat)
+                    continue
+                cur_attrs = cur.attributes()
+                new_attrs = new_feat.attributes()
+                if len(cur_attrs) != len(new_attrs):
+                    return False
+                changed = {i: v for i, v in enumerate(new_attrs) if v != cur_attrs[i]}
+                if changed:
+                    attr_changes[cur.id()] = changed
+                if cur.geometry().asWkb() != new_feat.geometry().asWkb():
+                    geom_changes[cur.id()] = new_feat.geometry()
+
+            # The edit-tracking slots must not see these edits: they are
+            # the server's own changes, and recording them (or letting
+            # commitChanges' editingStopped schedule a sync) would POST
+            # them straight back upstream on every refresh.
+            self._patching = True
+            try:
+                with edit(layer):
+                    if to_delete:
+                        layer.deleteFeatures(to_delete)
+                    for fid, changes in attr_changes.items():
+                        layer.changeAttributeValues(fid, changes)
+                    for fid, geom in geom_changes.items():
+                        layer.changeGeometry(fid, geom)
+                    if to_add:
+                        layer.addFeatures(to_add)
+            finally:
+                self._patching = False
+            self._clear_changes({layer.id()})
+            self._pending_sync.pop(layer.id(), None)
+            layer.triggerRepaint()
+            return True
+        except Exception:
+            return False
+
+    def connect_sync_signal(self, layer):
+        self._cache_field_names(layer)
+        layer.updatedFields.connect(self._on_fields_updated)
+        layer.featureAdded.connect(self._on_feature_added)
+        layer.featureDeleted.connect(self._on_feature_deleted)
+        layer.geometryChanged.connect(self._on_geometry_changed)
+        layer.attributeValueChanged.connect(self._on_attribute_changed)
+        layer.editingStopped.connect(self._on_editing_stopped)
+
+    # Edit-tracking slots. Connected without lambdas so high-frequency
+    # signals like attributeValueChanged don't allocate a closure per
+    # event; the originating layer is recovered via sender() and the
+    # dirty sets are keyed by (layer id, fid).
+    def _cache_field_names(self, layer):
+        fields = layer.fields()
+        self._field_names[layer.id()] = [fields.at(i).name() for i in range(fields.count())]
+
+    def _on_fields_updated(self):
+        self._cache_field_names(self.sender())
+
+    def _on_feature_added(self, fid):
+        if self._patching:
+            return
+        layer = self.sender()
+        self._added_features[(layer.id(), fid)] = layer.getFeature(fid)
+
+    def _on_feature_deleted(self, fid):
+        if self._patching:
+            return
+        self._deleted_ids.add((self.sender().id(), fid))
+
+    def _on_geometry_changed(self, fid, geom=None):
+        if self._patching:
+            return
+        self._edited_features.add((self.sender().id(), fid))
+
+    def _on_attribute_changed(self, fid, idx=None, val=None):
+        if self._patching:
+            return
+        self._edited_features.add((self.sender().id(), fid))
+
+    def _on_editing_stopped(self):
+        if self._patching:
+            return
+        # Debounce so saving several layers in quick succession becomes a
+        # single batched POST per endpoint rather than one POST per layer.
+        # Features are serialized here, while the layer is guaranteed
+        # alive; the flush may run after the layer is deleted (e.g. a save
+        # prompted by project close).
+        layer = self.sender()
+        config = self.layers.get(layer.name(), {})
+        features = self._collect_changed_features(layer)
+        self._pending_sync[layer.id()] = (
+            layer.name(), config.get("url", ""), config.get("token", ""), features
+        )
+        self._sync_debounce.start(250)
+
+    def _flush_pending_sync(self):
+        pending = self._pending_sync
+        self._pending_sync = {}
+
+        endpoints = {}
+        for lid, (layer_name, url, token, features) in pending.items():
+            if not features:
+                continue
+            for feature in features:
+                feature["__layer"] = layer_name
+            feats, layer_ids = endpoints.setdefault((url, token), ([], []))
+            feats.extend(features)
+            layer_ids.append(lid)
+
+        if not endpoints:
+            iface.messageBar().pushInfo("GeoJSON Viewer", "No changes to sync.")
+            return
+
+        for (url, token), (features, layer_ids) in endpoints.items():
+            payload = {"type": "FeatureCollection", "features": features}
+            worker = SyncWorker(self.session, url, token, payload, layer_ids)
+            worker.signals.finished.connect(self._on_sync_finished)
+            self.thread_pool.start(worker)
+
+    def _on_sync_finished(self, status, message, layer_ids):
+        if status == "success":
+            self._clear_changes(set(layer_ids))
+            iface.messageBar().pushSuccess("GeoJSON Viewer", message)
+        else:
+            iface.messageBar().pushCritical("GeoJSON Viewer", message)
 
-    def get_geojson_hash(self, url, token=""):
+    def get_geojson_hash(self, url, token="", name=None):
         try:
-            headers = {'Authorization': f'Bearer {token}'} if token else {}
-            response = requests.get(url, headers=headers)
+            headers = {'Accept-Encoding': 'gzip, deflate'}
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+            cached = self.layer_headers.get(name, {})
+            if cached.get('ETag') and name in self.layer_hashes:
+                # A HEAD answers "unchanged" in one ~200-byte round-trip;
+                # the body is only fetched when the ETag actually moved.
+                head = self.session.head(url, headers=headers, allow_redirects=True)
+                if head.status_code == 200 and head.headers.get('ETag') == cached['ETag']:
+                    return self.layer_hashes[name], None
+            if cached.get('ETag'):
+                headers['If-None-Match'] = cached['ETag']
+            if cached.get('Last-Modified'):
+                headers['If-Modified-Since'] = cached['Last-Modified']
+            response = self.session.get(url, headers=headers, stream=True)
+            if response.status_code == 304:
+                return self.layer_hashes.get(name), None
             if response.status_code != 200:
                 return None, None
-            return hashlib.md5(response.content).hexdigest(), response.content
+            if name:
+                validators = {}
+                for header in ('ETag', 'Last-Modified'):
+                    if header in response.headers:
+                        validators[header] = response.headers[header]
+                if validators:
+                    self.layer_headers[name] = validators
+            hasher = _content_hash()
+            buf = bytearray()
+            for chunk in response.iter_content(65536):
+                hasher.update(chunk)
+                buf += chunk
+            hash_val = hasher.hexdigest()
+            if name and self.layer_hashes.get(name) == hash_val:
+                return hash_val, None
+            return hash_val, bytes(buf)
         except Exception:
             return None, None
 
     def create_layer_from_content(self, content: bytes, name: str) -> QgsVectorLayer | None:
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".geojson") as tmp_file:
-                tmp_file.write(content)
-                tmp_file.flush()
-                layer_path = tmp_file.name
+            vsi_path = f"/vsimem/geojson_viewer/{name}_{id(content)}.geojson"
+            gdal.FileFromMemBuffer(vsi_path, content)
 
-            layer = QgsVectorLayer(layer_path, name, "ogr")
+            layer = QgsVectorLayer(vsi_path, name, "ogr")
             if not layer.isValid():
-                iface.messageBar().pushCritical("GeoJSON Viewer", f"Layer '{name}' failed to load from temporary file.")
+                gdal.Unlink(vsi_path)
+                iface.messageBar().pushCritical("GeoJSON Viewer", f"Layer '{name}' failed to load from memory buffer.")
                 return None
 
-            hidden_fields = []
+            previous = self._vsi_paths.get(name)
+            if previous and previous != vsi_path:
+                gdal.Unlink(previous)
+            self._vsi_paths[name] = vsi_path
+
+            fields = layer.fields()
             form_config = layer.editFormConfig()
+            hidden_fields = []
 
-            for field_name in ['id', 'fid']:
-                index = layer.fields().indexOf(field_name)
+            for field_name in ('id', 'fid'):
+                index = fields.lookupField(field_name)
                 if index != -1:
                     layer.setEditorWidgetSetup(index, QgsEditorWidgetSetup('Hidden', {}))
                     form_config.setReadOnly(index, True)
                     hidden_fields.append(field_name)
             if hidden_fields:
+                layer.setEditFormConfig(form_config)
                 layer.setCustomProperty("attributeTable/hiddenFields", hidden_fields)
 
             return layer
@@ -307,79 +688,155 @@ class GeoJsonViewer:
             iface.messageBar().pushCritical("GeoJSON Viewer", f"Error creating layer from content: {e}")
             return None
 
-    def convert_variant(self, val):
-        if isinstance(val, QVariant): val = val.value()
-        if hasattr(val, 'toPyObject'): val = val.toPyObject()
-        if isinstance(val, QDate): return val.toString("yyyy-MM-dd")
-        if isinstance(val, (str, numbers.Number, bool)) or val is None: return val
-        try: return str(val)
-        except Exception: return None
-
-    def sync_layer_to_server(self, layer, url, token=""):
-        try:
-            changed_ids = self._edited_features | set(self._added_features.keys())
-            if not changed_ids:
-                iface.messageBar().pushInfo("GeoJSON Viewer", "No changes to sync.")
-                return
-
-            features = []
-            for fid in self._edited_features:
-                feat = layer.getFeature(fid)
-                feature = self._serialize_feature(layer, feat)
+    def _collect_changed_features(self, layer):
+        lid = layer.id()
+        edited = {fid for owner, fid in self._edited_features if owner == lid}
+        added = {fid: feat for (owner, fid), feat in self._added_features.items() if owner == lid}
+        if not edited and not added:
+            return []
+
+        names = self._field_names.get(lid)
+        if names is None:
+            self._cache_field_names(layer)
+            names = self._field_names[lid]
+
+        return list(self._iter_changed_features(layer, edited, added, names))
+
+    def _iter_changed_features(self, layer, edited, added, names):
+        if edited:
+            request = QgsFeatureRequest().setFilterFids(list(edited))
+            for feat in layer.getFeatures(request):
+                feature = _serialize_feature(names, feat)
                 feature["__mode"] = "update"
-                features.append(feature)
-
-            for fid, feat in self._added_features.items():
-                feature = self._serialize_feature(layer, feat)
-                feature["__mode"] = "add"
-                features.append(feature)
-
-            payload = {"type": "FeatureCollection", "features": features}
-            headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, data=json.dumps(payload))
-
-            if response.status_code == 200:
-                self._edited_features.clear()
-                self._added_features.clear()
-                self._deleted_ids.clear()
-                msg = response.json().get("message", "Synced successfully.")
-                iface.messageBar().pushSuccess("GeoJSON Viewer", msg)
-            else:
-                iface.messageBar().pushCritical("GeoJSON Viewer", f"Sync failed: {response.status_code}")
-
-        except Exception as e:
-            iface.messageBar().pushCritical("GeoJSON Viewer", f"Sync error: {str(e)}")
-
-    def _serialize_feature(self, layer, feat):
-        geometry = feat.geometry()
-        props = feat.attributes()
-        geom_type = QgsWkbTypes.displayString(geometry.wkbType())
-        properties = {
-            layer.fields().at(i).name(): self.convert_variant(props[i])
-            for i in range(len(props))
-        }
-        return {
-            "type": geom_type,
-            "geometry": json.loads(geometry.asJson()),
-            "properties": properties
-        }
+                yield feature
+        for feat in added.values():
+            feature = _serialize_feature(names, feat)
+            feature["__mode"] = "add"
+            yield feature
+
+    def _clear_changes(self, layer_ids):
+        self._edited_features = {k for k in self._edited_features if k[0] not in layer_ids}
+        self._added_features = {k: v for k, v in self._added_features.items() if k[0] not in layer_ids}
+        self._deleted_ids = {k for k in self._deleted_ids if k[0] not in layer_ids}
+
+    def _release_vsi(self, name):
+        path = self._vsi_paths.pop(name, None)
+        if path:
+            gdal.Unlink(path)
 
     def delete_bookmark(self, name):
         if name in self.layers:
             del self.layers[name]
             self.layer_hashes.pop(name, None)
+            self.layer_headers.pop(name, None)
+            self._release_vsi(name)
             self.save_bookmarks()
             iface.messageBar().pushInfo("GeoJSON Viewer", f"Bookmark '{name}' deleted.")
 
     def refresh_layers(self):
-        for name, config in self.layers.items():
-            self.reload_layer(name, config.get("url", ""), config.get("token", ""))
+        # Single-flight: if a slow poll outlives the timer interval, skip
+        # this tick instead of stacking redundant downloads.
+        if self._pending_refreshes:
+            return
+        targets = [
+            (name, config.get("url", ""), config.get("token", ""))
+            for name, config in self.layers.items()
+        ]
+        if not targets:
+            return
+        self._pending_refreshes = len(targets)
+        if self._async_loop is not None:
+            asyncio.run_coroutine_threadsafe(self._poll_all(targets), self._async_loop)
+            return
+        for name, url, token in targets:
+            worker = RefreshWorker(self.get_geojson_hash, name, url, token)
+            worker.signals.finished.connect(self._on_refresh_finished)
+            self.thread_pool.start(worker)
+
+    async def _ensure_aio_session(self):
+        if self._aio_session is None:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+            )
+        return self._aio_session
+
+    async def _async_fetch(self, name, url, token):
+        """Async counterpart of get_geojson_hash: conditional GET, streamed
+        hash, None content when the layer is unchanged."""
+        try:
+            session = await self._ensure_aio_session()
+            headers = {'Accept-Encoding': 'gzip, deflate'}
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+            cached = self.layer_headers.get(name, {})
+            if cached.get('ETag'):
+                headers['If-None-Match'] = cached['ETag']
+            if cached.get('Last-Modified'):
+                headers['If-Modified-Since'] = cached['Last-Modified']
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return name, self.layer_hashes.get(name) or "", None
+                if response.status != 200:
+                    return name, "", None
+                validators = {
+                    header: response.headers[header]
+                    for header in ('ETag', 'Last-Modified') if header in response.headers
+                }
+                if validators:
+                    self.layer_headers[name] = validators
+                hasher = _content_hash()
+                buf = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    hasher.update(chunk)
+                    buf += chunk
+                hash_val = hasher.hexdigest()
+                if self.layer_hashes.get(name) == hash_val:
+                    return name, hash_val, None
+                return name, hash_val, bytes(buf)
+        except Exception:
+            return name, "", None
+
+    async def _poll_all(self, targets):
+        results = await asyncio.gather(
+            *(self._async_fetch(name, url, token) for name, url, token in targets)
+        )
+        for name, hash_val, content in results:
+            self.refresh_done.emit(name, hash_val, content)
+
+    def _shutdown_async(self):
+        if self._async_loop is None:
+            return
+        if self._aio_session is not None:
+            future = asyncio.run_coroutine_threadsafe(self._aio_session.close(), self._async_loop)
+            try:
+                future.result(2)
+            except Exception:
+                pass
+            self._aio_session = None
+        self._async_loop.call_soon_threadsafe(self._async_loop.stop)
+        self._async_loop = None
 
     def save_bookmarks(self):
+        # Coalesce bursts of adds/deletes into one QSettings write; the
+        # settings backend hits disk synchronously on the GUI thread. The
+        # settings key is captured now because QgsProject.clear() resets
+        # fileName() before emitting cleared, so reading it at flush time
+        # inside on_project_closed would come back empty.
         project_path = QgsProject.instance().fileName()
         if not project_path:
             return
-        self.settings.setValue(f"bookmarks/{project_path}", json.dumps(self.layers))
+        self._bookmarks_key = f"bookmarks/{project_path}"
+        self._save_timer.start(1000)
+
+    def _write_bookmarks(self):
+        if not self._bookmarks_key:
+            return
+        self.settings.setValue(self._bookmarks_key, _json_dumps(self.layers).decode())
+
+    def _flush_bookmark_save(self):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._write_bookmarks()
 
     def load_bookmarks(self):
         project_path = QgsProject.instance().fileName()
@@ -387,17 +844,17 @@ class GeoJsonViewer:
             return
         stored = self.settings.value(f"bookmarks/{project_path}", "{}")
         try:
-            self.layers = json.loads(stored)
+            self.layers = _json_loads(stored)
             for name, config in self.layers.items():
                 url = config.get("url", "")
                 token = config.get("token", "")
-                hash_val, content = self.get_geojson_hash(url, token)
+                hash_val, content = self.get_geojson_hash(url, token, name)
                 if hash_val and content:
                     self.layer_hashes[name] = hash_val
                     layer = self.create_layer_from_content(content, name)
                     if layer and layer.isValid():
                         QgsProject.instance().addMapLayer(layer)
-                        self.connect_sync_signal(layer, url, token)
+                        self.connect_sync_signal(layer)
         except Exception as e:
             iface.messageBar().pushCritical("GeoJSON Viewer", f"Failed to load bookmarks: {e}")
             self.layers = {}
@@ -410,6 +867,23 @@ class GeoJsonViewer:
         self.load_bookmarks()
 
     def on_project_closed(self):
+        # A close-time save commits edits and schedules a debounced sync;
+        # flush it now so those edits still reach the server, then drop
+        # the dirty state that refers to the layers being deleted.
+        if self._sync_debounce.isActive():
+            self._sync_debounce.stop()
+            self._flush_pending_sync()
+        self._pending_sync.clear()
+        self._edited_features.clear()
+        self._added_features.clear()
+        self._deleted_ids.clear()
+        self._flush_bookmark_save()
+        self._bookmarks_key = None
+        for name in list(self._vsi_paths):
+            self._release_vsi(name)
         self.layers.clear()
         self.layer_hashes.clear()
+        self.layer_headers.clear()
+        self._field_names.clear()
+        self._pending_refreshes = 0
         self.timer.stop()